@@ -1,11 +1,22 @@
 import requests
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, ValidationError
-from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.exceptions import InvalidHeader
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from pydantic import BaseModel, ConfigDict, ValidationError
+from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+import asyncio
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import time
 import random
-import json
+import threading
+import orjson
 import logging
 import os
 import re
@@ -18,7 +29,11 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 class Guide(BaseModel):
     """
     Pydantic model to define the strict structure of a Guide.
+    Frozen: assigning to a field raises, so a validated guide can't be changed
+    before it is serialized. (Not hashable: the list fields aren't.)
     """
+    model_config = ConfigDict(frozen=True)
+
     title: str
     author: str
     additional_text_boxes: List[str]
@@ -36,60 +51,328 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.101 Safari/537.36"
 ]
 
+_THREAD_STATE = threading.local()
+
+def _rng() -> random.Random:
+    """
+    Returns this thread's own Random instance, so UA picks from concurrent
+    fetch threads don't contend on the module-level generator.
+    """
+    rng = getattr(_THREAD_STATE, 'rng', None)
+    if rng is None:
+        rng = _THREAD_STATE.rng = random.Random()
+    return rng
+
 def get_random_headers():
     """Returns a header dict with a random User-Agent."""
     return {
-        'User-Agent': random.choice(USER_AGENTS),
+        'User-Agent': _rng().choice(USER_AGENTS),
         'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': ACCEPT_ENCODING, # gzip/deflate, plus br when brotli is installed
+        'Connection': 'keep-alive',
     }
 
+def _build_session() -> CachedSession:
+    """
+    Creates a Session with a pooled, retrying adapter so keep-alive connections
+    (and the TLS handshake) are reused across fetches to the same host.
+    Successful responses are cached on disk (SQLite in the user cache dir) for a
+    day, or as long as the server's Cache-Control allows, so re-runs don't
+    re-download pages.
+    """
+    session = CachedSession(
+        'crawl_cache',
+        backend='sqlite',
+        use_cache_dir=True,
+        expire_after=86400,
+        allowable_codes=(200,),
+        cache_control=True,
+    )
+    # Server errors are retried with exponential backoff. Retry-After is ignored
+    # here (urllib3 would otherwise retry any 429 carrying one, sleeping up to 6h),
+    # and 429s aren't retried: the response is returned (not a RetryError) so
+    # _polite_get can pause the whole host for the capped Retry-After instead.
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                  raise_on_status=False, respect_retry_after_header=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Shared across all fetches; the User-Agent still rotates per request via headers
+_SESSION = _build_session()
+
+class HostRateLimiter:
+    """
+    Token-bucket rate limiter keyed by host (netloc): each host allows up to
+    `burst` requests back to back, then refills at `rate` requests per second.
+    Only requests to the same host are spaced out, so fetches to different
+    domains never wait on each other. Thread-safe.
+    """
+    def __init__(self, rate: float = 0.3, burst: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, tuple] = {} # host -> (tokens, monotonic time of last update)
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> float:
+        """Takes a token for host, sleeping until one is available. Returns the seconds slept."""
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+            # Record the token as taken before sleeping; a negative balance is
+            # the queue of callers already waiting, so the next one waits longer
+            self._buckets[host] = (tokens, now)
+            delay = 0.0 if tokens >= 0 else -tokens / self.rate
+
+        if delay > 0:
+            logging.info(f"Rate limit for {host}: waiting {delay:.2f}s...")
+            time.sleep(delay)
+        return delay
+
+    def penalize(self, host: str, delay: float):
+        """
+        Holds back the next request to host for at least delay seconds, e.g. the
+        Retry-After of a 429. Callers already sleeping keep their slots.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            # The balance must refill back to one token before the next request goes out
+            self._buckets[host] = (min(tokens, 1 - delay * self.rate), now)
+        logging.warning(f"Rate limited by {host}: pausing requests for {delay:.0f}s")
+
+# Politeness state, shared by all fetch threads
+_RATE_LIMITER = HostRateLimiter()
+_ROBOTS: Dict[str, RobotFileParser] = {}
+
+# Pause applied to a host that answers 429 without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 60.0
+# Longest pause honoured, so one header can't park fetch threads for hours
+MAX_RETRY_AFTER = 300.0
+
+def _retry_after_seconds(value: Optional[str]) -> float:
+    """
+    Parses a Retry-After header (seconds or HTTP date) into seconds to wait,
+    capped at MAX_RETRY_AFTER.
+    """
+    delay = DEFAULT_RETRY_AFTER
+    if value:
+        try:
+            delay = Retry().parse_retry_after(value)
+        except InvalidHeader:
+            pass
+    if delay > MAX_RETRY_AFTER:
+        logging.warning(f"Retry-After of {delay:.0f}s capped at {MAX_RETRY_AFTER:.0f}s")
+        delay = MAX_RETRY_AFTER
+    return delay
+
+# --- 2. Parsing Selectors (built once at import) ---
+
+# C-backed lxml tree builder when available, stdlib parser otherwise
+try:
+    import lxml # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Tag-name sets for the per-element membership tests in the index and sibling walks
+_HEADER_TAG_SET = frozenset({'h2', 'h3', 'h4'})
+_LIST_TAG_SET = frozenset({'ul', 'ol'})
+_CONTAINER_TAG_SET = frozenset({'div', 'section'})
+_STEP_TEXT_TAG_SET = frozenset({'p', 'div', 'li'})
+
+# "Step N" prefix: identifies step headers and keeps step-like paragraphs out of the intro text
+_STEP_HEADER_RE = re.compile(r"^Step\s+\d+", re.I)
+_SUPPLIES_LABEL_RE = re.compile(r"what you'll need|supplies|things you'll need", re.I)
+_SUPPLIES_HEADER_RE = re.compile(r"Things You'll Need|Supplies|What You Will Need", re.I)
+# Raw-markup test for "How to" (space written literally or as a decimal/hex
+# character reference, zero-padded or not, semicolon optional), run before any
+# tree is built: the title filter needs the phrase inside one text node, so a
+# page without it can never pass
+_HOW_TO_RE = re.compile(r"how(?: |&#0*32;?|&#x0*20;?)to", re.I)
+
+# Tags parse_html never reads. SoupStrainer only filters top-level elements, so
+# html/head are listed too: they are descended into instead of being
+# materialized whole, which lets the <head> metadata and scripts be dropped
+# unbuilt. <body> is kept whole: its children would otherwise become top-level,
+# and bs4 drops top-level strings (bare step text directly under <body>).
+_UNPARSED_TAGS = frozenset({'html', 'head', 'title', 'meta', 'link', 'script', 'style', 'svg', 'template'})
+
+def _is_content_tag(name, attrs=None) -> bool:
+    return name not in _UNPARSED_TAGS
+
+_ARTICLE_STRAINER = SoupStrainer(_is_content_tag)
+
+# Category pages are only read for their links
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
 # --- 3. Core Functions ---
 
+def _cached_response(url: str, headers: dict) -> Optional[requests.Response]:
+    """
+    Returns the stored response for url when the HTTP cache can serve it without
+    contacting the server, or None when getting it would reach the server (a miss,
+    or a stale entry that has to be revalidated first).
+    """
+    response = _SESSION.get(url, headers=headers, timeout=10, only_if_cached=True)
+    # requests-cache answers 504 instead of sending the request (only 200s are stored)
+    return None if response.status_code == 504 else response
+
+def _polite_get(url: str, headers: dict) -> requests.Response:
+    """
+    GETs url from the HTTP cache when possible. Anything that would reach the
+    server, conditional revalidations included, first takes a token from the
+    host's rate limiter.
+    """
+    response = _cached_response(url, headers)
+    if response is not None:
+        return response
+
+    host = urlparse(url).netloc
+    _RATE_LIMITER.acquire(host)
+    response = _SESSION.get(url, headers=headers, timeout=10)
+    if response.status_code == 429:
+        # Throttled: back off the whole host
+        _RATE_LIMITER.penalize(host, _retry_after_seconds(response.headers.get('Retry-After')))
+    return response
+
+def is_allowed_by_robots(url: str, user_agent: str) -> bool:
+    """
+    Checks the host's robots.txt (fetched once per host and cached) for url.
+    Mirrors RobotFileParser.read(): 401/403 disallow everything, other 4xx allow
+    everything. A 5xx disallows everything (RFC 9309) but isn't remembered, so
+    robots.txt is asked for again on the next request to the host. If robots.txt
+    cannot be fetched at all, the URL is allowed.
+    """
+    parts = urlparse(url)
+    parser = _ROBOTS.get(parts.netloc)
+    if parser is None:
+        parser = RobotFileParser()
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        try:
+            response = _polite_get(robots_url, get_random_headers())
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif 400 <= response.status_code < 500:
+                parser.allow_all = True
+            elif response.status_code >= 500:
+                logging.warning(f"{robots_url} returned {response.status_code}, treating {url} as disallowed")
+                return False
+            else:
+                parser.parse(response.text.splitlines())
+        except requests.RequestException as e:
+            logging.warning(f"Could not fetch {robots_url}, assuming allowed: {e}")
+            parser.allow_all = True
+        _ROBOTS[parts.netloc] = parser
+
+    return parser.can_fetch(user_agent, url)
+
 def fetch_page(url: str) -> Optional[str]:
     """
-    Fetches the HTML content of a page with random delays and user-agent rotation.
+    Fetches the HTML content of a page (or its cached copy) with per-host rate limiting,
+    robots.txt checks and user-agent rotation.
     """
     try:
         headers = get_random_headers()
         
-        # Random delay to behave like a human (2 to 5 seconds)
-        delay = random.uniform(2, 5)
-        logging.info(f"Waiting {delay:.2f}s before requesting {url}...")
-        time.sleep(delay)
+        if not is_allowed_by_robots(url, headers['User-Agent']):
+            logging.warning(f"Skipping {url}: disallowed by robots.txt")
+            return None
         
-        response = requests.get(url, headers=headers, timeout=15)
+        # Rate limited per host; cache hits never reach the server, so they skip it
+        response = _polite_get(url, headers)
         response.raise_for_status() # Raise error for bad status codes (4xx, 5xx)
         
+        # No charset in Content-Type: requests would decode text/html as ISO-8859-1
+        # (and run charset detection over the body for other types), but the
+        # site serves UTF-8
+        if 'charset=' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        
         return response.text
     except requests.RequestException as e:
         logging.error(f"Error fetching URL {url}: {e}")
         return None
 
+@lru_cache(maxsize=4096)
 def make_absolute_url(url: str, base_url: str) -> str:
     """
     Converts a relative URL to an absolute URL using the base URL.
+    Memoized: pages repeat the same (src, base_url) pairs many times.
     """
     if not url:
         return ""
     # If already absolute, return as is
-    if urlparse(url).netloc:
+    if url.startswith(('http://', 'https://')):
         return url
-    # Convert relative to absolute
+    # Root-relative path without dot segments: plain origin + path, exactly what
+    # urljoin would produce ('//host' is scheme-relative, so it isn't one, and
+    # urljoin drops a trailing empty '?' or '#')
+    if (url.startswith('/') and not url.startswith('//') and '/.' not in url
+            and not url.endswith(('?', '#'))):
+        return _origin(base_url) + url
+    # Convert relative (or scheme-relative '//host/...') to absolute
     return urljoin(base_url, url)
 
-def save_single_guide(guide_data: dict, output_dir: str = "raw_data"):
+@lru_cache(maxsize=256)
+def _origin(base_url: str) -> str:
+    """Returns 'scheme://netloc' of base_url, parsed once per page."""
+    parts = urlparse(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+# Characters not allowed in file names on Windows/macOS/Linux
+_FNAME_INVALID_RE = re.compile(r'[\\/*?:"<>|]')
+
+# One JSON line per saved guide, appended as the crawl goes (crash-safe corpus)
+MANIFEST_FILENAME = "guides.ndjson"
+
+# Output directories already created by this process, so makedirs runs once per dir
+_CREATED_DIRS = set()
+
+def _dump_json(obj, path: str):
     """
-    Validates and saves a single guide to a JSON file.
+    Writes obj as indented JSON to path. orjson always emits UTF-8 bytes, so no
+    ensure_ascii/text-mode encoding pass. The bytes go to a temp file that is
+    fsynced and then atomically renamed over path: a crash never leaves a
+    half-written file behind, and a failed write leaves no temp file either.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        # Buffered file: write() loops until every byte is written
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def save_single_guide(guide_data: dict, output_dir: str = "raw_data", validate: bool = True):
+    """
+    Validates and atomically saves a single guide to a JSON file, and appends
+    it as one line to the NDJSON manifest in the same directory.
+    Callers holding data already known to match Guide can pass validate=False
+    to build the model with model_construct() and skip validation.
     """
     try:
         # Validate
-        guide = Guide(**guide_data)
+        if validate:
+            guide = Guide.model_validate(guide_data)
+        else:
+            guide = Guide.model_construct(**guide_data)
         
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in _CREATED_DIRS:
+            os.makedirs(output_dir, exist_ok=True)
+            _CREATED_DIRS.add(output_dir)
         
         # Generate filename from title
-        safe_title = re.sub(r'[\\/*?:"<>|]', "", guide.title) # Remove invalid chars
+        safe_title = _FNAME_INVALID_RE.sub("", guide.title) # Remove invalid chars
         safe_title = safe_title.replace(" ", "_").lower()[:50] # Slugify roughly
         filename = f"{safe_title}.json"
         file_path = os.path.join(output_dir, filename)
@@ -97,8 +380,18 @@ def save_single_guide(guide_data: dict, output_dir: str = "raw_data"):
         # Check if file exists to avoid overwriting (optional, but good practice)
         # For now, we overwrite or add number? Let's overwrite as it might be an update.
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(guide.model_dump(), f, indent=4, ensure_ascii=False)
+        guide_dict = guide.model_dump()
+        
+        _dump_json(guide_dict, file_path)
+        
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), 'ab+') as f:
+            # Terminate a line left truncated by an interrupted run, so this
+            # record starts on its own line instead of being glued to it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+            f.write(orjson.dumps(guide_dict, option=orjson.OPT_APPEND_NEWLINE))
             
         logging.info(f"Saved guide to {file_path}")
         return True
@@ -110,6 +403,25 @@ def save_single_guide(guide_data: dict, output_dir: str = "raw_data"):
         logging.error(f"File write error: {e}")
         return False
 
+def load_saved_urls(output_dir: str = "raw_data") -> set:
+    """
+    Returns the source URLs of guides already recorded in the NDJSON manifest,
+    so a re-run can skip them without fetching or parsing anything.
+    """
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    saved_urls = set()
+    try:
+        with open(manifest_path, 'rb') as f:
+            for line in f:
+                try:
+                    saved_urls.add(orjson.loads(line)['url'])
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    # e.g. a line cut short by an interrupted run
+                    logging.warning(f"Ignoring malformed line in {manifest_path}")
+    except FileNotFoundError:
+        pass
+    return saved_urls
+
 def fetch_category_links(category_url: str) -> List[str]:
     """
     Fetches article links from a category page, filtering for 'How to' articles.
@@ -118,41 +430,114 @@ def fetch_category_links(category_url: str) -> List[str]:
     if not html:
         return []
     
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_LINK_STRAINER)
     article_links = []
+    seen_links = set() # O(1) dedup; the list keeps page order
     
     # Strategy: Find all links, filter by "how-to" in text or href
     # Note: DIY.com often has "How to..." as link text
     
     for a in soup.find_all('a', href=True):
         href = a['href']
-        text = a.get_text(strip=True)
         
         # Filter logic:
         # 1. Must be an article (heuristic: not a category page, often has /stry/ or just specific pattern)
         # 2. Text or Title must start with "How to" (case insensitive)
+        # The href test is a cheap attribute check, so the link text is only
+        # extracted for anchors it doesn't already accept.
         
-        if "how to" in text.lower() or "how-to" in href.lower():
+        if "how-to" in href.lower() or "how to" in a.get_text(strip=True).lower():
             full_url = make_absolute_url(href, category_url)
-            if full_url not in article_links and full_url != category_url:
+            if full_url not in seen_links and full_url != category_url:
+                seen_links.add(full_url)
                 article_links.append(full_url)
     
     logging.info(f"Found {len(article_links)} potential 'How-to' articles in category.")
     return article_links
 
+def _list_item_texts(list_tag: Tag) -> List[str]:
+    """Returns the non-empty stripped text of each <li>, extracting each text once."""
+    return [text for li in list_tag.find_all('li') if (text := li.get_text(strip=True))]
+
+def _list_items_after(marker: Tag) -> List[str]:
+    """
+    Returns the items of the first list following marker among its sibling
+    tags (a <ul>/<ol>, or a <ul> inside a container), stopping at the next header.
+    Only tags are visited, so whitespace text nodes between siblings are skipped.
+    """
+    for sibling in marker.find_next_siblings():
+        if sibling.name in _LIST_TAG_SET:
+            return _list_item_texts(sibling)
+        if sibling.name in _CONTAINER_TAG_SET:
+            ul = sibling.find('ul')
+            if ul:
+                return _list_item_texts(ul)
+        elif sibling.name in _HEADER_TAG_SET:
+            # Hit next section
+            break
+    return []
+
+def _index_page(soup: BeautifulSoup) -> dict:
+    """
+    Walks the document once and records the elements parse_html needs (first
+    match for each fixed probe, plus every 'Step N' header in document order),
+    instead of one soup.find()/find_all() pass per probe.
+    Header text is matched against .string, like find(string=...).
+    """
+    found = {'step_headers': []}
+    for el in soup.descendants:
+        if not isinstance(el, Tag):
+            continue
+        classes = el.get('class') or ()
+        if el.name == 'h1':
+            found.setdefault('h1', el)
+            if 'how-to__article-title' in classes:
+                found.setdefault('title', el)
+        elif el.name in _HEADER_TAG_SET:
+            header_text = el.string
+            if header_text is not None:
+                if _STEP_HEADER_RE.search(header_text):
+                    found['step_headers'].append(el)
+                if _SUPPLIES_HEADER_RE.search(header_text):
+                    found.setdefault('supplies_header', el)
+        if 'author-name' in classes:
+            found.setdefault('author_by_class', el)
+        rel = el.get('rel') or ()
+        if isinstance(rel, str):
+            # rel is only split into a list on <a>/<link>; elsewhere it is a plain
+            # string, where `in` would be a substring test ('coauthor')
+            rel = rel.split()
+        if 'author' in rel:
+            found.setdefault('author_by_rel', el)
+        if 'article-body' in classes:
+            found.setdefault('body_by_class', el)
+        if el.get('id') == 'article-body':
+            found.setdefault('body_by_id', el)
+        if el.name == 'div' and 'tool-and-material__content' in classes:
+            found.setdefault('tools', el)
+        label = el.get('click0label')
+        if label and _SUPPLIES_LABEL_RE.search(label):
+            found.setdefault('supplies_label', el)
+    return found
+
 def parse_html(html_content: str, base_url: str) -> Optional[dict]:
     """
     Parses raw HTML to extract guide data specific to doityourself.com
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if not _HOW_TO_RE.search(html_content):
+            logging.warning(f"Skipping {base_url}: Page does not mention 'How to'")
+            return None
+        
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_ARTICLE_STRAINER)
+        page = _index_page(soup)
         
         # --- Extract Title ---
         # User specified: class="how-to__article-title"
-        title_tag = soup.find('h1', class_='how-to__article-title')
+        title_tag = page.get('title')
         if not title_tag:
              # Fallback
-             title_tag = soup.find('h1')
+             title_tag = page.get('h1')
         
         title = title_tag.get_text(strip=True) if title_tag else "Unknown Title"
         
@@ -168,51 +553,12 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
         # --- Extract Author ---
         # Common pattern: <span class="author-name"> or similar
         author = "Unknown Author"
-        author_tag = soup.find(class_='author-name') or soup.find(rel='author')
+        author_tag = page.get('author_by_class') or page.get('author_by_rel')
         if author_tag:
             author = author_tag.get_text(strip=True)
 
         # --- Extract Additional Text Boxes ---
         # Strategy: capture all significant text paragraphs that are NOT part of supplies or steps
-        additional_text_boxes = []
-        
-        article_body = soup.find(class_='article-body') or soup.find(id='article-body')
-        
-        if article_body:
-            # We iterate through direct children or all elements?
-            # Safer to iterate all elements and skip those we know are steps/supplies?
-            # Or just grab all 'p' and filter? 
-            # Given structure, let's grab all text immediately in 'p' tags inside article body
-            
-            # Helper to check if text belongs to a step or supply
-            # This is hard because steps parsing is dynamic.
-            
-            # Alternative Strategy:
-            # We already have logical sections for Supplies and Steps.
-            # We can traverse the siblings again and classify them.
-            
-            # Let's try a scan of the article body.
-            
-            for elem in article_body.descendants:
-                if elem.name == 'p':
-                    text = elem.get_text(strip=True)
-                    if len(text) > 20: 
-                        # Heuristic: Check if this text is already in supplies or steps?
-                        # This might be slow if steps are huge.
-                        
-                        # Better: The previous parsers (supplies/steps) extracted specific parts.
-                        # Maybe we can just extract everything not "Step X" or "Things Needed"
-                        
-                        # Let's assume additional text matches 'p' content that doesn't start with "Step"
-                        # and isn't in a list <ul>/<ol>
-                        
-                        is_step = re.match(r"^Step\s+\d+", text, re.I)
-                        if not is_step:
-                             # Check if it's a list item (parent is li)
-                             if elem.parent.name != 'li':
-                                  additional_text_boxes.append(text)
-        
-        # Deduplication might be needed if traversal is recursive
         
         # Refined Strategy (simpler):
         # Intro text: between Title and first header
@@ -224,25 +570,33 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
         content_candidates = []
         start_elem = author_tag if author_tag else title_tag
         if start_elem:
-            curr = start_elem.next_sibling
-            while curr:
-                if hasattr(curr, 'name'):
-                    if curr.name in ['h2', 'h3', 'h4']:
-                         # If it's a Step header or Supplies header, we skip it and its content?
-                         # Wait, we want to capture text "before and after".
-                         pass
-                    
-                    if curr.name == 'p':
-                         text = curr.get_text(strip=True)
-                         if len(text) > 30: # Filter small
-                             # Exclude if it looks like a step starter
-                             if not re.match(r"^Step\s+\d+", text, re.I):
-                                 content_candidates.append(text)
-                                 
-                curr = curr.next_sibling
+            # Only <p> siblings can qualify, so let bs4 skip text nodes and other tags
+            for curr in start_elem.find_next_siblings('p'):
+                text = curr.get_text(strip=True)
+                if len(text) > 30: # Filter small
+                    # Exclude if it looks like a step starter
+                    if not _STEP_HEADER_RE.match(text):
+                        content_candidates.append(text)
                 
-        if content_candidates:
-            additional_text_boxes = content_candidates
+        additional_text_boxes = content_candidates
+        
+        article_body = page.get('body_by_class') or page.get('body_by_id')
+        
+        # Only scan the whole article body when the cheap sibling walk found nothing
+        if not additional_text_boxes and article_body:
+            # Let's try a scan of the article body's paragraphs.
+            
+            for elem in article_body.find_all('p'):
+                text = elem.get_text(strip=True)
+                if len(text) > 20: 
+                    # Let's assume additional text matches 'p' content that doesn't start with "Step"
+                    # and isn't in a list <ul>/<ol>
+                    
+                    is_step = _STEP_HEADER_RE.match(text)
+                    if not is_step:
+                         # Check if it's a list item (parent is li)
+                         if elem.parent.name != 'li':
+                              additional_text_boxes.append(text)
 
         # --- Extract Supplies ---
         supplies = []
@@ -250,87 +604,57 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
         
         # Strategy 1: Specific Class Structure (tool-and-material__content)
         # Look for div with class 'tool-and-material__content' and inside 'col-12'
-        tools_container = soup.find('div', class_='tool-and-material__content')
+        tools_container = page.get('tools')
         if tools_container:
             # Find all col-12 divs inside
             items = tools_container.find_all('div', class_='col-12')
+            seen_supplies = set()
             for item in items:
                 text = item.get_text(strip=True)
-                if text and text not in supplies:
+                if text and text not in seen_supplies:
+                    seen_supplies.add(text)
                     supplies.append(text)
 
         if not supplies:
             # Strategy 2: Look for specific attribute 'click0label'
             # User mentioned: click0label="what You'll Need"
-            supplies_elem_attr = soup.find(attrs={"click0label": re.compile(r"what you'll need|supplies|things you'll need", re.I)})
+            supplies_elem_attr = page.get('supplies_label')
             
             if supplies_elem_attr:
                 # This element might be the header or the container
                 # If it's a header (h2, div), look for siblings
                 # If it contains ul/ol, extract directly
                 
-                if supplies_elem_attr.name in ['ul', 'ol']:
-                     supplies = [li.get_text(strip=True) for li in supplies_elem_attr.find_all('li') if li.get_text(strip=True)]
+                if supplies_elem_attr.name in _LIST_TAG_SET:
+                     supplies = _list_item_texts(supplies_elem_attr)
                 else:
                      # Check children first
                      ul = supplies_elem_attr.find('ul')
                      if ul:
-                         supplies = [li.get_text(strip=True) for li in ul.find_all('li') if li.get_text(strip=True)]
+                         supplies = _list_item_texts(ul)
                      
                      if not supplies:
                          # Check next siblings like before
-                         curr = supplies_elem_attr.find_next_sibling()
-                         found_list = False
-                         while curr and not found_list:
-                            if curr.name in ['ul', 'ol']:
-                                supplies = [li.get_text(strip=True) for li in curr.find_all('li') if li.get_text(strip=True)]
-                                found_list = True
-                            elif curr.name in ['div', 'section']:
-                                 ul = curr.find('ul')
-                                 if ul:
-                                     supplies = [li.get_text(strip=True) for li in ul.find_all('li') if li.get_text(strip=True)]
-                                     found_list = True
-                            
-                            if hasattr(curr, 'name') and curr.name in ['h2', 'h3', 'h4']:
-                                break
-                            curr = curr.next_sibling
+                         supplies = _list_items_after(supplies_elem_attr)
 
         if not supplies:
             # Strategy 3: Fallback to text header search
             # Find header - include "What You Will Need" and "Supplies"
-            supplies_header = soup.find(['h2', 'h3', 'h4'], string=re.compile(r"Things You'll Need|Supplies|What You Will Need", re.I))
+            supplies_header = page.get('supplies_header')
             
             if supplies_header:
                 # Usually followed by a list <ul> or <div>
-                # Get next sibling that is a list or container
-                curr = supplies_header.find_next_sibling()
-                # aggressive search for list
-                found_list = False
-                while curr and not found_list:
-                    if curr.name in ['ul', 'ol']:
-                        supplies = [li.get_text(strip=True) for li in curr.find_all('li') if li.get_text(strip=True)]
-                        found_list = True
-                    elif curr.name in ['div', 'section']:
-                         # Check if list inside
-                         ul = curr.find('ul')
-                         if ul:
-                             supplies = [li.get_text(strip=True) for li in ul.find_all('li') if li.get_text(strip=True)]
-                             found_list = True
-                    
-                    if hasattr(curr, 'name') and curr.name in ['h2', 'h3', 'h4']:
-                        # Hit next section
-                        break
-                        
-                    curr = curr.next_sibling
+                supplies = _list_items_after(supplies_header)
         
         # --- Extract Steps and Images ---
         steps_data = [] # List of [headline, text]
         image_urls = []
+        seen_image_urls = set() # O(1) dedup; the list keeps document order
         
         # DoItYourself often uses specific headers for steps like "Step 1: ..."
         
         # Find all step headers
-        step_headers = soup.find_all(['h2', 'h3', 'h4'], string=re.compile(r"^Step\s+\d+", re.I))
+        step_headers = page['step_headers']
         
         if step_headers:
             for header in step_headers:
@@ -341,9 +665,10 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
                 header_text = header.get_text(strip=True)
                 
                 while current_element:
-                    if hasattr(current_element, 'name') and current_element.name in ['h2', 'h3', 'h4']:
+                    is_tag = isinstance(current_element, Tag) # Siblings mix Tags and NavigableStrings
+                    if is_tag and current_element.name in _HEADER_TAG_SET:
                         # Check if it's another step or something else
-                        if re.match(r"^Step\s+\d+", current_element.get_text(strip=True) or "", re.I):
+                        if _STEP_HEADER_RE.match(current_element.get_text(strip=True) or ""):
                              break # Next step
                         # Else it might be a subsection, keep going?
                         # Usually "Step" headers are at same level.
@@ -354,9 +679,9 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
                         text = current_element.strip()
                         if text:
                             step_content.append(text)
-                    elif hasattr(current_element, 'name'):
+                    elif is_tag:
                          # Extract text
-                        if current_element.name in ['p', 'div', 'li']: 
+                        if current_element.name in _STEP_TEXT_TAG_SET: 
                             text = current_element.get_text(strip=True)
                             if text:
                                 step_content.append(text)
@@ -371,7 +696,8 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
                              src = img.get('src')
                              if src:
                                  abs_url = make_absolute_url(src, base_url)
-                                 if abs_url not in image_urls:
+                                 if abs_url not in seen_image_urls:
+                                     seen_image_urls.add(abs_url)
                                      image_urls.append(abs_url)
 
                     current_element = current_element.next_sibling
@@ -383,26 +709,26 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
             # Fallback for guides without explicit "Step X" headers
             # Maybe just content?
             # Look for article body
-            article_body = soup.find(class_='article-body') or soup.find(id='article-body')
+            article_body = page.get('body_by_class') or page.get('body_by_id')
             if article_body:
-                # Just get paragraphs
+                # Paragraphs and images in one pass over the body
                 current_step_text = []
-                for p in article_body.find_all('p'):
-                    text = p.get_text(strip=True)
-                    if len(text) > 20:
-                        current_step_text.append(text)
+                for elem in article_body.find_all(['p', 'img']):
+                    if elem.name == 'p':
+                        text = elem.get_text(strip=True)
+                        if len(text) > 20:
+                            current_step_text.append(text)
+                    else:
+                        src = elem.get('src')
+                        if src:
+                            abs_url = make_absolute_url(src, base_url)
+                            if abs_url not in seen_image_urls:
+                                seen_image_urls.add(abs_url)
+                                image_urls.append(abs_url)
                 
                 if current_step_text:
                      steps_data.append(["Instruction", " ".join(current_step_text)]) # Single step fallback
 
-                # Images
-                for img in article_body.find_all('img'):
-                     src = img.get('src')
-                     if src:
-                         abs_url = make_absolute_url(src, base_url)
-                         if abs_url not in image_urls:
-                             image_urls.append(abs_url)
-
         if not steps_data:
              logging.warning(f"No steps extracted for {base_url}")
              return None
@@ -426,6 +752,61 @@ def parse_html(html_content: str, base_url: str) -> Optional[dict]:
 
 # --- 4. Execution Logic (Main Loop) ---
 
+MAX_GUIDES = 5
+
+async def crawl(target_urls: List[str], max_guides: int = MAX_GUIDES) -> int:
+    """
+    Fetches, parses and saves the target URLs concurrently.
+    Each host gets its own semaphore so the politeness delay in fetch_page still
+    applies per domain, while fetches to different hosts overlap. Parsing is
+    CPU-bound, so it runs in a process pool to use every core.
+    Returns the number of guides saved.
+    """
+    loop = asyncio.get_running_loop()
+    host_sems = {}
+    for url in target_urls:
+        host_sems.setdefault(urlparse(url).netloc, asyncio.Semaphore(1))
+
+    success_count = 0
+
+    async def process(url: str):
+        nonlocal success_count
+
+        # Step A: Fetch (blocking requests call runs in a worker thread)
+        async with host_sems[urlparse(url).netloc]:
+            if success_count >= max_guides:
+                return
+            logging.info(f"Processing: {url}")
+            html = await loop.run_in_executor(None, fetch_page, url)
+
+        if not html:
+            logging.warning(f"Skipping {url} due to fetch error.")
+            return
+
+        # Step B: Parse (in a worker process so other fetches keep going)
+        data = await loop.run_in_executor(parse_pool, parse_html, html, url)
+        if not data:
+            logging.warning(f"Failed to parse content from {url}")
+            return
+
+        # Step C: Save immediately
+        if success_count >= max_guides:
+            return
+        # parse_html always builds the exact Guide shape, so skip re-validating it
+        if save_single_guide(data, validate=False):
+            success_count += 1
+            logging.info(f"Successfully scraped: {data['title']}")
+
+            if success_count >= max_guides:
+                print(f"Reached limit of {max_guides} guides. Stopping.")
+
+    # spawn, not fork: the pool starts on the first submit, after fetch threads
+    # exist, and forking a multi-threaded process can deadlock the child
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             mp_context=multiprocessing.get_context('spawn')) as parse_pool:
+        await asyncio.gather(*(process(url) for url in target_urls))
+    return success_count
+
 def main():
     category_url = "https://www.doityourself.com/scat/freezer"
     
@@ -440,31 +821,15 @@ def main():
 
     print(f"Found {len(target_urls)} articles to process.")
     
-    # 2. Main Loop
-    success_count = 0
-    for url in target_urls:
-        logging.info(f"Processing: {url}")
-        
-        # Step A: Fetch
-        html = fetch_page(url)
-        
-        if html:
-            # Step B: Parse
-            data = parse_html(html, url)
-            
-            if data:
-                # Step C: Save immediately
-                if save_single_guide(data):
-                    success_count += 1
-                    logging.info(f"Successfully scraped: {data['title']}")
-                    
-                    if success_count >= 5:
-                        print("Reached limit of 5 guides. Stopping.")
-                        break
-            else:
-                logging.warning(f"Failed to parse content from {url}")
-        else:
-            logging.warning(f"Skipping {url} due to fetch error.")
+    # Resume: guides saved by a previous run are skipped before any fetch
+    saved_urls = load_saved_urls()
+    if saved_urls:
+        pending_urls = [url for url in target_urls if url not in saved_urls]
+        print(f"Skipping {len(target_urls) - len(pending_urls)} already saved guides.")
+        target_urls = pending_urls
+    
+    # 2. Concurrent fetch -> parse -> save pipeline
+    success_count = asyncio.run(crawl(target_urls))
 
     print(f"--- Crawler Finished. Processed {success_count} guides. ---")
 
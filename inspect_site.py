@@ -17,10 +17,13 @@ def fetch_and_analyze():
     }
     
     print(f"Fetching category: {cat_url}")
+    # One Session for both fetches, so the second reuses the keep-alive connection
+    session = requests.Session()
+    session.headers.update(headers)
     try:
-        resp = requests.get(cat_url, headers=headers, timeout=10)
+        resp = session.get(cat_url, timeout=10)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = BeautifulSoup(resp.text, 'lxml')
         
         # Find article links
         # Heuristic: look for links with "How to" in text
@@ -47,9 +50,9 @@ def fetch_and_analyze():
         target_url = article_links[0][1]
         print(f"\nAnalyzing Article: {target_url}")
         
-        resp = requests.get(target_url, headers=headers, timeout=10)
+        resp = session.get(target_url, timeout=10)
         resp.raise_for_status()
-        article_soup = BeautifulSoup(resp.text, 'html.parser')
+        article_soup = BeautifulSoup(resp.text, 'lxml')
         
         # Check specific selectors
         print("\n--- Title candidates ---")
@@ -0,0 +1,50 @@
+"""
+Unit tests for the fetch_category_links function from crawler.py
+"""
+from unittest.mock import patch
+from crawler import fetch_category_links
+
+
+CATEGORY_URL = "https://www.doityourself.com/scat/freezer"
+
+CATEGORY_HTML = """<html><body>
+<a href="/">Home</a>
+<a href="/scat/freezer">Freezer</a>
+<a href="/stry/how-to-defrost-an-upright-freezer">Defrosting Guide</a>
+<a href="/stry/fix-a-leak">How To Fix a Leaking Freezer</a>
+<a href="https://www.doityourself.com/stry/how-to-defrost-an-upright-freezer">How to Defrost an Upright Freezer</a>
+<a href="/stry/best-freezers">Best Freezers of the Year</a>
+<a name="no-href">How to nowhere</a>
+</body></html>"""
+
+
+class TestFetchCategoryLinks:
+    """Test cases for the fetch_category_links function"""
+
+    @patch('crawler.fetch_page')
+    def test_fetch_category_links_filters_how_to(self, mock_fetch):
+        """Test that only 'How to' links are returned, absolute, deduplicated and in page order"""
+        # Setup mocks
+        mock_fetch.return_value = CATEGORY_HTML
+
+        # Execute
+        result = fetch_category_links(CATEGORY_URL)
+
+        # Assert
+        assert result == [
+            "https://www.doityourself.com/stry/how-to-defrost-an-upright-freezer",
+            "https://www.doityourself.com/stry/fix-a-leak",
+        ]
+        mock_fetch.assert_called_once_with(CATEGORY_URL)
+
+    @patch('crawler.fetch_page')
+    def test_fetch_category_links_fetch_error(self, mock_fetch):
+        """Test that a failed category fetch yields no links"""
+        # Setup mocks
+        mock_fetch.return_value = None
+
+        # Execute
+        result = fetch_category_links(CATEGORY_URL)
+
+        # Assert
+        assert result == []
@@ -1,27 +1,44 @@
 """
-Unit tests for the fetch_page function from crawler.py
+Unit tests for fetch_page, is_allowed_by_robots and HostRateLimiter from crawler.py
 """
+import io
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
-from crawler import fetch_page
+from requests_cache import CachedSession
+from urllib3 import HTTPResponse
+import crawler
+from crawler import fetch_page, is_allowed_by_robots, HostRateLimiter
 
 
 class TestFetchPage:
     """Test cases for the fetch_page function"""
 
+    def setup_method(self):
+        """Start every test with a fresh rate limiter, cache misses and robots.txt allowing all"""
+        self.limiter_patcher = patch('crawler._RATE_LIMITER', crawler.HostRateLimiter())
+        self.limiter_patcher.start()
+        self.robots_patcher = patch('crawler.is_allowed_by_robots', return_value=True)
+        self.mock_robots = self.robots_patcher.start()
+        self.cache_patcher = patch('crawler._cached_response', return_value=None)
+        self.mock_cached = self.cache_patcher.start()
+
+    def teardown_method(self):
+        self.limiter_patcher.stop()
+        self.robots_patcher.stop()
+        self.cache_patcher.stop()
+
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_success(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_success(self, mock_get, mock_choice, mock_sleep):
         """Test successful page fetch"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 2.5  # Fixed delay for testing
         mock_response = Mock()
         mock_response.text = "<html><body>Test Content</body></html>"
         mock_response.raise_for_status = Mock()  # No exception raised
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
         mock_get.return_value = mock_response
 
         # Execute
@@ -29,7 +46,7 @@ class TestFetchPage:
 
         # Assert
         assert result == "<html><body>Test Content</body></html>"
-        mock_sleep.assert_called_once_with(2.5)
+        mock_sleep.assert_not_called()  # First request to this host
         mock_get.assert_called_once()
         call_args = mock_get.call_args
         assert call_args[0][0] == "https://www.example.com/test"
@@ -37,14 +54,12 @@ class TestFetchPage:
         assert call_args[1]["timeout"] == 10
 
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_http_error(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_http_error(self, mock_get, mock_choice, mock_sleep):
         """Test handling of HTTP error (4xx, 5xx)"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 2.5
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
         mock_get.return_value = mock_response
@@ -57,14 +72,12 @@ class TestFetchPage:
         mock_get.assert_called_once()
 
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_connection_error(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_connection_error(self, mock_get, mock_choice, mock_sleep):
         """Test handling of connection error"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 2.5
         mock_get.side_effect = requests.ConnectionError("Connection failed")
 
         # Execute
@@ -75,14 +88,12 @@ class TestFetchPage:
         mock_get.assert_called_once()
 
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_timeout(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_timeout(self, mock_get, mock_choice, mock_sleep):
         """Test handling of timeout error"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 2.5
         mock_get.side_effect = requests.Timeout("Request timed out")
 
         # Execute
@@ -93,18 +104,17 @@ class TestFetchPage:
         mock_get.assert_called_once()
 
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_headers_set_correctly(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_headers_set_correctly(self, mock_get, mock_choice, mock_sleep):
         """Test that headers are set correctly with random user agent"""
         # Setup mocks
         test_user_agent = "Mozilla/5.0 (Custom Test Agent)"
         mock_choice.return_value = test_user_agent
-        mock_uniform.return_value = 2.5
         mock_response = Mock()
         mock_response.text = "Test"
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
         mock_get.return_value = mock_response
 
         # Execute
@@ -116,43 +126,102 @@ class TestFetchPage:
         assert headers["User-Agent"] == test_user_agent
         assert "Accept-Language" in headers
         assert headers["Accept-Language"] == "en-US,en;q=0.9"
+        assert headers["Connection"] == "keep-alive"
+        assert "gzip" in headers["Accept-Encoding"]
 
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_delay_called(self, mock_get, mock_choice, mock_uniform, mock_sleep):
-        """Test that delay is called before making request"""
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_delay_called(self, mock_get, mock_choice, mock_sleep):
+        """Test that a request to a host with no tokens left waits for the next one"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 3.7
         mock_response = Mock()
         mock_response.text = "Test"
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        mock_get.return_value = mock_response
+        limiter = crawler.HostRateLimiter(rate=0.25, burst=1)
+
+        # Execute: second request to the host comes 1s after the first
+        with patch('crawler._RATE_LIMITER', limiter), \
+                patch('crawler.time.monotonic', side_effect=[100.0, 101.0]):
+            fetch_page("https://www.example.com/first")
+            fetch_page("https://www.example.com/second")
+
+        # Assert the remaining 3s of the 4s refill interval was slept
+        mock_sleep.assert_called_once_with(pytest.approx(3.0))
+        assert mock_get.call_count == 2
+
+    @patch('crawler.time.sleep')
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_no_delay_across_hosts(self, mock_get, mock_choice, mock_sleep):
+        """Test that requests to different hosts do not wait on each other"""
+        # Setup mocks
+        mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
+        mock_response = Mock()
+        mock_response.text = "Test"
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
         mock_get.return_value = mock_response
 
         # Execute
         fetch_page("https://www.example.com/test")
+        fetch_page("https://www.example.org/test")
+
+        # Assert
+        mock_sleep.assert_not_called()
+        assert mock_get.call_count == 2
+
+    @patch('crawler.time.sleep')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_cache_hit_skips_delay(self, mock_get, mock_sleep):
+        """Test that a cached page is returned without waiting on the host"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.text = "Cached"
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.mock_cached.return_value = mock_response
+        limiter = crawler.HostRateLimiter(rate=0.25, burst=1)
+        limiter.acquire("www.example.com")  # Host has no tokens left
 
-        # Assert delay was called with correct value
-        mock_uniform.assert_called_once_with(2, 5)
-        mock_sleep.assert_called_once_with(3.7)
-        # Verify sleep was called before get
-        assert mock_sleep.call_count == 1
-        assert mock_get.call_count == 1
+        # Execute
+        with patch('crawler._RATE_LIMITER', limiter):
+            result = fetch_page("https://www.example.com/test")
+
+        # Assert
+        assert result == "Cached"
+        mock_sleep.assert_not_called()
+        mock_get.assert_not_called()
 
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_empty_response(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_disallowed_by_robots(self, mock_get, mock_sleep):
+        """Test that URLs disallowed by robots.txt are not requested"""
+        # Setup mocks
+        self.mock_robots.return_value = False
+
+        # Execute
+        result = fetch_page("https://www.example.com/private")
+
+        # Assert
+        assert result is None
+        mock_get.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    @patch('crawler.time.sleep')
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_empty_response(self, mock_get, mock_choice, mock_sleep):
         """Test handling of empty response"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 2.5
         mock_response = Mock()
         mock_response.text = ""  # Empty response
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
         mock_get.return_value = mock_response
 
         # Execute
@@ -162,15 +231,38 @@ class TestFetchPage:
         assert result == ""
         mock_get.assert_called_once()
 
+    @pytest.mark.parametrize("content_type, expected", [
+        ("text/html", "utf-8"),  # requests would pick ISO-8859-1 here
+        ("text/html; charset=windows-1252", "windows-1252"),
+    ])
     @patch('crawler.time.sleep')
-    @patch('crawler.random.uniform')
-    @patch('crawler.random.choice')
-    @patch('crawler.requests.get')
-    def test_fetch_page_request_exception(self, mock_get, mock_choice, mock_uniform, mock_sleep):
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_undeclared_charset_defaults_to_utf8(self, mock_get, mock_choice, mock_sleep,
+                                                             content_type, expected):
+        """Test that a response without a charset in Content-Type is decoded as UTF-8"""
+        # Setup mocks
+        mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
+        mock_response = Mock()
+        mock_response.text = "Test"
+        mock_response.headers = requests.structures.CaseInsensitiveDict({"Content-Type": content_type})
+        mock_response.encoding = requests.utils.get_encoding_from_headers(mock_response.headers)
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        # Execute
+        fetch_page("https://www.example.com/test")
+
+        # Assert
+        assert mock_response.encoding == expected
+
+    @patch('crawler.time.sleep')
+    @patch('crawler.random.Random.choice')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_request_exception(self, mock_get, mock_choice, mock_sleep):
         """Test handling of generic RequestException"""
         # Setup mocks
         mock_choice.return_value = "Mozilla/5.0 (Test Browser)"
-        mock_uniform.return_value = 2.5
         mock_get.side_effect = requests.RequestException("Generic request error")
 
         # Execute
@@ -180,3 +272,296 @@ class TestFetchPage:
         assert result is None
         mock_get.assert_called_once()
 
+    @patch('crawler.time.sleep')
+    @patch('crawler._SESSION.get')
+    def test_fetch_page_429_pauses_host(self, mock_get, mock_sleep):
+        """Test that a 429 holds back the next request to the host for Retry-After seconds"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "120"}
+        mock_response.raise_for_status.side_effect = requests.HTTPError("429 Too Many Requests")
+        mock_get.return_value = mock_response
+        limiter = crawler.HostRateLimiter(rate=0.5, burst=3)
+
+        # Execute
+        with patch('crawler._RATE_LIMITER', limiter), \
+                patch('crawler.time.monotonic', return_value=100.0):
+            result = fetch_page("https://www.example.com/busy")
+            delay = limiter.acquire("www.example.com")
+
+        # Assert
+        assert result is None
+        assert delay == pytest.approx(120.0)
+
+    @patch('time.sleep')
+    def test_fetch_page_429_through_adapter_waits_only_capped_pause(self, mock_sleep):
+        """Test that the session's retrying adapter leaves a 429 to the limiter's capped pause"""
+        # Setup mocks
+        raw = HTTPResponse(body=io.BytesIO(b""), headers={"Retry-After": "86400"}, status=429,
+                           preload_content=False)
+        session = CachedSession(backend="memory")
+        session.mount("https://", crawler._SESSION.get_adapter("https://"))
+        limiter = crawler.HostRateLimiter(rate=0.5, burst=3)
+
+        # Execute
+        with patch('crawler._SESSION', session), patch('crawler._RATE_LIMITER', limiter), \
+                patch('crawler.time.monotonic', return_value=100.0), \
+                patch('urllib3.connectionpool.HTTPConnectionPool._make_request',
+                      return_value=raw) as mock_request:
+            result = fetch_page("https://www.example.com/busy")
+            slept_during_fetch = mock_sleep.call_count
+            limiter.acquire("www.example.com")
+
+        # Assert
+        assert result is None
+        mock_request.assert_called_once()
+        assert slept_during_fetch == 0
+        mock_sleep.assert_called_once_with(pytest.approx(crawler.MAX_RETRY_AFTER))
+
+
+class _FakeSiteAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter serving one page with an ETag, answering 304 to a matching If-None-Match"""
+
+    def __init__(self, cache_control):
+        super().__init__()
+        self.cache_control = cache_control
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        headers = {
+            "Content-Type": "text/html; charset=utf-8",
+            "Cache-Control": self.cache_control,
+            "ETag": '"v1"',
+        }
+        if request.headers.get("If-None-Match") == '"v1"':
+            status, body = 304, b""
+        else:
+            status, body = 200, b"<html><body>Guide</body></html>"
+        raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=status,
+                           preload_content=False, request_url=request.url)
+        return requests.adapters.HTTPAdapter().build_response(request, raw)
+
+    def close(self):
+        pass
+
+
+class TestFetchPageHttpCache:
+    """Test cases for fetch_page against a real (in-memory) HTTP cache"""
+
+    def setup_method(self):
+        self.session = CachedSession(backend="memory", expire_after=86400, allowable_codes=(200,),
+                                     cache_control=True)
+        self.patchers = [
+            patch('crawler._SESSION', self.session),
+            patch('crawler.is_allowed_by_robots', return_value=True),
+        ]
+        self.mock_limiter = Mock()
+        self.patchers.append(patch('crawler._RATE_LIMITER', self.mock_limiter))
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_fresh_entry_skips_rate_limiter(self):
+        """Test that a fresh cached page is served without touching the server or the limiter"""
+        # Setup
+        adapter = _FakeSiteAdapter("max-age=3600")
+        self.session.mount("https://", adapter)
+
+        # Execute
+        first = fetch_page("https://www.example.com/guide")
+        second = fetch_page("https://www.example.com/guide")
+
+        # Assert
+        assert first == second == "<html><body>Guide</body></html>"
+        assert len(adapter.requests) == 1
+        self.mock_limiter.acquire.assert_called_once_with("www.example.com")
+
+    @pytest.mark.parametrize("cache_control", ["no-cache", "max-age=0, must-revalidate"])
+    def test_revalidated_entry_goes_through_rate_limiter(self, cache_control):
+        """Test that every request reaching the server, revalidations included, took a limiter token"""
+        # Setup
+        adapter = _FakeSiteAdapter(cache_control)
+        self.session.mount("https://", adapter)
+
+        # Execute
+        fetch_page("https://www.example.com/guide")
+        result = fetch_page("https://www.example.com/guide")
+
+        # Assert
+        assert result == "<html><body>Guide</body></html>"
+        assert self.mock_limiter.acquire.call_count == len(adapter.requests)
+
+
+class TestIsAllowedByRobots:
+    """Test cases for the is_allowed_by_robots function"""
+
+    def setup_method(self):
+        """Start every test with no robots.txt remembered, cache misses and a fresh rate limiter"""
+        crawler._ROBOTS.clear()
+        self.patchers = [
+            patch('crawler._cached_response', return_value=None),
+            patch('crawler._RATE_LIMITER', crawler.HostRateLimiter()),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    @patch('crawler._SESSION.get')
+    def test_robots_rules_applied_and_cached(self, mock_get):
+        """Test that robots.txt is fetched once per host and its rules are applied"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "User-agent: *\nDisallow: /private/\n"
+        mock_get.return_value = mock_response
+
+        # Execute
+        allowed = is_allowed_by_robots("https://www.example.com/stry/guide", "TestAgent")
+        blocked = is_allowed_by_robots("https://www.example.com/private/page", "TestAgent")
+
+        # Assert
+        assert allowed is True
+        assert blocked is False
+        mock_get.assert_called_once()
+        assert mock_get.call_args[0][0] == "https://www.example.com/robots.txt"
+
+    @pytest.mark.parametrize("status_code, expected", [(403, False), (404, True), (503, False)])
+    @patch('crawler._SESSION.get')
+    def test_robots_error_status(self, mock_get, status_code, expected):
+        """Test that 401/403 and 5xx disallow everything and other 4xx allow everything"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_get.return_value = mock_response
+
+        # Execute
+        result = is_allowed_by_robots("https://www.example.com/stry/guide", "TestAgent")
+
+        # Assert
+        assert result is expected
+
+    @patch('crawler._SESSION.get')
+    def test_robots_fetch_is_rate_limited(self, mock_get):
+        """Test that fetching robots.txt takes a token from the host's rate limiter"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+        limiter = Mock()
+
+        # Execute
+        with patch('crawler._RATE_LIMITER', limiter):
+            is_allowed_by_robots("https://www.example.com/stry/guide", "TestAgent")
+
+        # Assert
+        limiter.acquire.assert_called_once_with("www.example.com")
+
+    @patch('crawler._SESSION.get')
+    def test_robots_server_error_not_remembered(self, mock_get):
+        """Test that robots.txt is asked for again after a 5xx"""
+        # Setup mocks
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_get.return_value = mock_response
+
+        # Execute
+        is_allowed_by_robots("https://www.example.com/stry/guide", "TestAgent")
+        is_allowed_by_robots("https://www.example.com/stry/other", "TestAgent")
+
+        # Assert
+        assert mock_get.call_count == 2
+
+    @patch('crawler._SESSION.get')
+    def test_robots_unreachable(self, mock_get):
+        """Test that an unreachable robots.txt allows the URL"""
+        # Setup mocks
+        mock_get.side_effect = requests.ConnectionError("Connection failed")
+
+        # Execute
+        result = is_allowed_by_robots("https://www.example.com/stry/guide", "TestAgent")
+
+        # Assert
+        assert result is True
+
+
+class TestHostRateLimiter:
+    """Test cases for the HostRateLimiter class"""
+
+    @patch('crawler.time.sleep')
+    def test_acquire_allows_burst_then_waits(self, mock_sleep):
+        """Test that a burst goes out at once and the next request waits for a refill"""
+        # Setup
+        limiter = HostRateLimiter(rate=0.5, burst=2)
+
+        # Execute
+        with patch('crawler.time.monotonic', return_value=100.0):
+            delays = [limiter.acquire("www.example.com") for _ in range(4)]
+
+        # Assert: queued callers wait one refill interval (2s) behind each other
+        assert delays == [0.0, 0.0, pytest.approx(2.0), pytest.approx(4.0)]
+        assert mock_sleep.call_count == 2
+
+    @patch('crawler.time.sleep')
+    def test_acquire_refills_over_time(self, mock_sleep):
+        """Test that tokens come back at the configured rate, capped at the burst size"""
+        # Setup
+        limiter = HostRateLimiter(rate=0.5, burst=2)
+
+        # Execute: drain the bucket, then come back long after it is full again
+        with patch('crawler.time.monotonic', side_effect=[100.0, 100.0, 200.0, 200.0, 200.0]):
+            delays = [limiter.acquire("www.example.com") for _ in range(5)]
+
+        # Assert
+        assert delays == [0.0, 0.0, 0.0, 0.0, pytest.approx(2.0)]
+
+    @patch('crawler.time.sleep')
+    def test_acquire_is_per_host(self, mock_sleep):
+        """Test that draining one host's bucket does not delay another host"""
+        # Setup
+        limiter = HostRateLimiter(rate=0.5, burst=1)
+        limiter.acquire("www.example.com")
+
+        # Execute
+        delay = limiter.acquire("www.example.org")
+
+        # Assert
+        assert delay == 0.0
+        mock_sleep.assert_not_called()
+
+    @patch('crawler.time.sleep')
+    def test_penalize_holds_back_next_request(self, mock_sleep):
+        """Test that penalize makes the next request wait the full pause, even with tokens left"""
+        # Setup
+        limiter = HostRateLimiter(rate=0.5, burst=3)
+
+        # Execute
+        with patch('crawler.time.monotonic', return_value=100.0):
+            limiter.penalize("www.example.com", 30)
+            delay = limiter.acquire("www.example.com")
+
+        # Assert
+        assert delay == pytest.approx(30.0)
+        mock_sleep.assert_called_once_with(pytest.approx(30.0))
+
+    @pytest.mark.parametrize("value, expected", [
+        ("120", 120),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0),  # Date already in the past
+        ("86400", crawler.MAX_RETRY_AFTER),  # Capped
+        ("soon", crawler.DEFAULT_RETRY_AFTER),
+        (None, crawler.DEFAULT_RETRY_AFTER),
+    ])
+    def test_retry_after_seconds(self, value, expected):
+        """Test that Retry-After accepts seconds or an HTTP date, capped, with a default otherwise"""
+        # Execute
+        result = crawler._retry_after_seconds(value)
+
+        # Assert
+        assert result == expected
@@ -0,0 +1,50 @@
+"""
+Unit tests for the make_absolute_url function from crawler.py
+"""
+import pytest
+from urllib.parse import urljoin
+from crawler import make_absolute_url
+
+
+BASE_URL = "https://www.doityourself.com/stry/how-to-fix-a-freezer?page=2"
+
+
+class TestMakeAbsoluteUrl:
+    """Test cases for the make_absolute_url function"""
+
+    @pytest.mark.parametrize("url", [
+        "/images/step1.jpg",
+        "/images/step1.jpg?w=640#top",
+    "/images/step1.jpg?",
+    "/images/step1.jpg#",
+        "/images/../step1.jpg",
+        "/./images/step1.jpg",
+        "//cdn.example.com/step1.jpg",
+        "images/step1.jpg",
+        "../images/step1.jpg",
+        "?page=3",
+        "#comments",
+    ])
+    def test_make_absolute_url_matches_urljoin(self, url):
+        """Test that relative URLs resolve exactly as urljoin resolves them"""
+        # Execute
+        result = make_absolute_url(url, BASE_URL)
+
+        # Assert
+        assert result == urljoin(BASE_URL, url)
+
+    def test_make_absolute_url_keeps_absolute_url(self):
+        """Test that absolute URLs are returned unchanged"""
+        # Execute
+        result = make_absolute_url("https://cdn.example.com/step2.jpg", BASE_URL)
+
+        # Assert
+        assert result == "https://cdn.example.com/step2.jpg"
+
+    def test_make_absolute_url_empty(self):
+        """Test that an empty URL stays empty"""
+        # Execute
+        result = make_absolute_url("", BASE_URL)
+
+        # Assert
+        assert result == ""
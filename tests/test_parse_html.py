@@ -0,0 +1,266 @@
+"""
+Unit tests for the parse_html function from crawler.py
+"""
+import pytest
+from unittest.mock import patch
+from crawler import Guide, parse_html
+
+
+BASE_URL = "https://www.doityourself.com/stry/how-to-fix-a-freezer"
+
+ARTICLE_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<title>How to Fix a Freezer</title>
+<script>var tracking = "Step 9 - Not a step";</script>
+<style>p { color: red; }</style>
+</head>
+<body>
+<div class="header"><a href="/">Home</a></div>
+<div class="article">
+  <h1 class="how-to__article-title">How to Fix a Freezer</h1>
+  <span class="author-name">Jane Doe</span>
+  <p>This introduction paragraph explains why the freezer needs fixing today.</p>
+  <p>Short one.</p>
+  <div class="tool-and-material__content">
+    <div class="col-12">Screwdriver</div>
+    <div class="col-12">Towel</div>
+    <div class="col-12">Screwdriver</div>
+  </div>
+  <h2>Step 1 - Unplug</h2>
+  <p>Unplug the freezer from the wall outlet.</p>
+  <img src="/images/step1.jpg">
+  <h2>Step 2 - Clean</h2>
+  <p>Wipe the coils with a damp towel.</p>
+  <div><img src="https://cdn.example.com/step2.jpg"><img src="/images/step1.jpg"></div>
+  <h3>Tip</h3>
+  <p>Be careful around the coils.</p>
+</div>
+</body>
+</html>
+"""
+
+
+class TestParseHtml:
+    """Test cases for the parse_html function"""
+
+    def test_parse_html_extracts_fields(self):
+        """Test that title, author, supplies and url are extracted"""
+        # Execute
+        result = parse_html(ARTICLE_HTML, BASE_URL)
+
+        # Assert
+        assert result["title"] == "How to Fix a Freezer"
+        assert result["author"] == "Jane Doe"
+        assert result["supplies"] == ["Screwdriver", "Towel"]
+        assert result["url"] == BASE_URL
+
+    @pytest.mark.parametrize("html", [
+        ARTICLE_HTML,
+        "<html><body><h1>How to Level It</h1><div id='article-body'><p>Adjust the front feet until the freezer sits level.</p></div></body></html>",
+    ])
+    def test_parse_html_output_is_a_valid_guide(self, html):
+        """Test that parse_html output matches Guide, which crawl() relies on to save with validate=False"""
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert Guide.model_validate(result).model_dump() == result
+
+    def test_parse_html_extracts_steps(self):
+        """Test that each 'Step N' header becomes a [headline, content] pair"""
+        # Execute
+        result = parse_html(ARTICLE_HTML, BASE_URL)
+
+        # Assert
+        assert result["steps"] == [
+            ["Step 1 - Unplug", "Unplug the freezer from the wall outlet."],
+            ["Step 2 - Clean", "Wipe the coils with a damp towel. Be careful around the coils."],
+        ]
+
+    def test_parse_html_keeps_bare_step_text_under_body(self):
+        """Test that bare text after a step header directly under <body> is kept"""
+        # Setup
+        html = "<html><body><h1>How to Fix It</h1><h2>Step 1: Go</h2>Bare text<p>para</p></body></html>"
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["steps"] == [["Step 1: Go", "Bare text para"]]
+
+    def test_parse_html_extracts_unique_absolute_image_urls(self):
+        """Test that step images are made absolute and deduplicated in order"""
+        # Execute
+        result = parse_html(ARTICLE_HTML, BASE_URL)
+
+        # Assert
+        assert result["image_urls"] == [
+            "https://www.doityourself.com/images/step1.jpg",
+            "https://cdn.example.com/step2.jpg",
+        ]
+
+    def test_parse_html_additional_text_boxes(self):
+        """Test that long non-step paragraphs after the author are collected"""
+        # Execute
+        result = parse_html(ARTICLE_HTML, BASE_URL)
+
+        # Assert
+        assert result["additional_text_boxes"][0] == (
+            "This introduction paragraph explains why the freezer needs fixing today."
+        )
+        assert "Short one." not in result["additional_text_boxes"]
+
+    def test_parse_html_body_fallback_without_step_headers(self):
+        """Test the single-step fallback for articles without 'Step N' headers"""
+        # Setup
+        html = """<html><body>
+        <h1>How to Defrost a Freezer</h1>
+        <div class="article-body">
+          <p>Turn the freezer off and empty it completely.</p>
+          <p>Leave the door open until all the ice has melted.</p>
+          <img src="/images/defrost.jpg">
+        </div>
+        </body></html>"""
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["title"] == "How to Defrost a Freezer"
+        assert result["author"] == "Unknown Author"
+        assert result["steps"] == [[
+            "Instruction",
+            "Turn the freezer off and empty it completely. Leave the door open until all the ice has melted.",
+        ]]
+        assert result["image_urls"] == ["https://www.doityourself.com/images/defrost.jpg"]
+        assert result["additional_text_boxes"] == [
+            "Turn the freezer off and empty it completely.",
+            "Leave the door open until all the ice has melted.",
+        ]
+
+    def test_parse_html_author_rel_and_body_id(self):
+        """Test the rel="author" and id="article-body" fallbacks"""
+        # Setup
+        html = """<html><body>
+        <h1>How to Level a Freezer</h1>
+        <p>By <a rel="author" href="/authors/sam">Sam Smith</a></p>
+        <div id="article-body">
+          <p>Adjust the front feet until the freezer sits level.</p>
+        </div>
+        </body></html>"""
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["author"] == "Sam Smith"
+        assert result["steps"] == [["Instruction", "Adjust the front feet until the freezer sits level."]]
+
+    def test_parse_html_author_rel_is_not_a_substring_match(self):
+        """Test that rel="coauthor" on a non-link tag is not taken as the author"""
+        # Setup
+        html = """<html><body>
+        <h1>How to Level a Freezer</h1>
+        <span rel="coauthor">Not Me</span>
+        <span rel="author">Sam Smith</span>
+        <div id="article-body">
+          <p>Adjust the front feet until the freezer sits level.</p>
+        </div>
+        </body></html>"""
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["author"] == "Sam Smith"
+
+    def test_parse_html_supplies_from_header_list(self):
+        """Test that supplies are read from the list following a 'Things You'll Need' header"""
+        # Setup
+        html = ARTICLE_HTML.replace(
+            '<div class="tool-and-material__content">',
+            "<h2>Things You'll Need</h2><ul><li>Gloves</li><li> </li><li>Bucket</li></ul><div>",
+        )
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["supplies"] == ["Gloves", "Bucket"]
+
+    def test_parse_html_supplies_stop_at_next_header(self):
+        """Test that a list belonging to a later section is not taken as supplies"""
+        # Setup
+        html = ARTICLE_HTML.replace(
+            '<div class="tool-and-material__content">',
+            "<h2>Things You'll Need</h2>\n<p>Nothing special.</p>\n<h3>Safety</h3><ul><li>Gloves</li></ul><div>",
+        )
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["supplies"] == []
+
+    def test_parse_html_supplies_from_click0label(self):
+        """Test that supplies are read from the list after a click0label marker"""
+        # Setup
+        html = ARTICLE_HTML.replace(
+            '<div class="tool-and-material__content">',
+            '<div click0label="What You\'ll Need">Tools</div><p>Gather these:</p><div><ul><li>Gloves</li></ul></div><div>',
+        )
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["supplies"] == ["Gloves"]
+
+    @pytest.mark.parametrize("title", ["Best Freezers of the Year", "Why you need to know how to defrost"])
+    def test_parse_html_rejects_non_how_to_titles(self, title):
+        """Test that articles whose title does not start with 'How to' are skipped"""
+        # Setup
+        html = ARTICLE_HTML.replace("How to Fix a Freezer</h1>", f"{title}</h1>")
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result is None
+
+    def test_parse_html_skips_tree_build_without_how_to(self):
+        """Test that a page never mentioning 'How to' is rejected before any parsing"""
+        # Setup
+        html = ARTICLE_HTML.replace("How to Fix a Freezer", "Freezer Buying Guide")
+
+        # Execute
+        with patch("crawler.BeautifulSoup") as mock_soup:
+            result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result is None
+        mock_soup.assert_not_called()
+
+    @pytest.mark.parametrize("space", ["&#32;", "&#032;", "&#x20;", "&#x0020;", "&#X20;", "&#32"])
+    def test_parse_html_how_to_with_character_reference(self, space):
+        """Test that the raw-markup prefilter accepts a 'How to' whose space is a character reference"""
+        # Setup
+        html = ARTICLE_HTML.replace("How to Fix a Freezer", f"How{space}to Fix a Freezer")
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result["title"] == "How to Fix a Freezer"
+
+    def test_parse_html_no_steps(self):
+        """Test that an article without any steps returns None"""
+        # Setup
+        html = "<html><body><h1>How to Do Nothing</h1><p>Nothing to see here.</p></body></html>"
+
+        # Execute
+        result = parse_html(html, BASE_URL)
+
+        # Assert
+        assert result is None
@@ -0,0 +1,139 @@
+"""
+Unit tests for the save_single_guide and load_saved_urls functions from crawler.py
+"""
+import json
+import pytest
+from unittest.mock import patch
+from crawler import save_single_guide, load_saved_urls
+
+
+@pytest.fixture
+def guide_data():
+    return {
+        "title": "How to Fix a Freezer: Part 1?",
+        "author": "Jane Doe",
+        "additional_text_boxes": ["Freezers need love – and a screwdriver."],
+        "supplies": ["Screwdriver", "Towel"],
+        "steps": [["Step 1 - Unplug", "Unplug the freezer from the wall outlet."]],
+        "image_urls": ["https://www.doityourself.com/images/step1.jpg"],
+        "url": "https://www.doityourself.com/stry/how-to-fix-a-freezer",
+    }
+
+
+class TestSaveSingleGuide:
+    """Test cases for the save_single_guide function"""
+
+    def test_save_single_guide_writes_json(self, tmp_path, guide_data):
+        """Test that a valid guide is written to a slugified JSON file"""
+        # Execute
+        result = save_single_guide(guide_data, output_dir=str(tmp_path))
+
+        # Assert
+        assert result is True
+        file_path = tmp_path / "how_to_fix_a_freezer_part_1.json"
+        assert file_path.exists()
+        with open(file_path, encoding="utf-8") as f:
+            assert json.load(f) == guide_data
+
+    def test_save_single_guide_keeps_unicode(self, tmp_path, guide_data):
+        """Test that non-ASCII text is written as UTF-8, not escaped"""
+        # Execute
+        save_single_guide(guide_data, output_dir=str(tmp_path))
+
+        # Assert
+        content = (tmp_path / "how_to_fix_a_freezer_part_1.json").read_text(encoding="utf-8")
+        assert "love – and" in content
+
+    def test_save_single_guide_replaces_existing_file(self, tmp_path, guide_data):
+        """Test that re-saving a guide replaces its file and leaves no temp file behind"""
+        # Setup
+        (tmp_path / "how_to_fix_a_freezer_part_1.json").write_text("stale", encoding="utf-8")
+
+        # Execute
+        save_single_guide(guide_data, output_dir=str(tmp_path))
+
+        # Assert
+        with open(tmp_path / "how_to_fix_a_freezer_part_1.json", encoding="utf-8") as f:
+            assert json.load(f) == guide_data
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_save_single_guide_failed_write_leaves_no_temp_file(self, tmp_path, guide_data):
+        """Test that a failed write keeps the old file and removes the temp file"""
+        # Setup
+        (tmp_path / "how_to_fix_a_freezer_part_1.json").write_text("old", encoding="utf-8")
+
+        # Execute
+        with patch("crawler.os.replace", side_effect=OSError("disk full")):
+            result = save_single_guide(guide_data, output_dir=str(tmp_path))
+
+        # Assert
+        assert result is False
+        assert (tmp_path / "how_to_fix_a_freezer_part_1.json").read_text(encoding="utf-8") == "old"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_save_single_guide_appends_manifest_line(self, tmp_path, guide_data):
+        """Test that every saved guide is appended as one line to the NDJSON manifest"""
+        # Execute
+        save_single_guide(guide_data, output_dir=str(tmp_path))
+        save_single_guide(dict(guide_data, title="How to Defrost a Freezer"), output_dir=str(tmp_path))
+
+        # Assert
+        lines = (tmp_path / "guides.ndjson").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == guide_data
+        assert json.loads(lines[1])["title"] == "How to Defrost a Freezer"
+
+    def test_save_single_guide_without_validation(self, tmp_path, guide_data):
+        """Test that validate=False still writes trusted data unchanged"""
+        # Execute
+        result = save_single_guide(guide_data, output_dir=str(tmp_path), validate=False)
+
+        # Assert
+        assert result is True
+        with open(tmp_path / "how_to_fix_a_freezer_part_1.json", encoding="utf-8") as f:
+            assert json.load(f) == guide_data
+
+    def test_save_single_guide_validation_error(self, tmp_path, guide_data):
+        """Test that invalid guide data is rejected and nothing is written"""
+        # Setup
+        del guide_data["steps"]
+
+        # Execute
+        result = save_single_guide(guide_data, output_dir=str(tmp_path))
+
+        # Assert
+        assert result is False
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestLoadSavedUrls:
+    """Test cases for the load_saved_urls function"""
+
+    def test_load_saved_urls_from_manifest(self, tmp_path, guide_data):
+        """Test that URLs of previously saved guides are read back from the manifest"""
+        # Setup
+        save_single_guide(guide_data, output_dir=str(tmp_path))
+        with open(tmp_path / "guides.ndjson", "ab") as f:
+            f.write(b'{"title": "How to cut')  # Truncated by an interrupted run
+        save_single_guide(
+            dict(guide_data, title="How to Defrost a Freezer",
+                 url="https://www.doityourself.com/stry/how-to-defrost-a-freezer"),
+            output_dir=str(tmp_path),
+        )
+
+        # Execute
+        result = load_saved_urls(str(tmp_path))
+
+        # Assert
+        assert result == {
+            "https://www.doityourself.com/stry/how-to-fix-a-freezer",
+            "https://www.doityourself.com/stry/how-to-defrost-a-freezer",
+        }
+
+    def test_load_saved_urls_without_manifest(self, tmp_path):
+        """Test that a missing manifest means nothing has been saved yet"""
+        # Execute
+        result = load_saved_urls(str(tmp_path))
+
+        # Assert
+        assert result == set()